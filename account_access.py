@@ -3,6 +3,15 @@ AccountAccess Module
 Manages user permissions with strict encapsulation and verification requirements.
 """
 
+import sys
+
+
+def _norm(permission):
+    """Normalize a permission name, skipping the .upper() copy when possible."""
+    if permission.isupper() and permission.isascii():
+        return permission
+    return permission.upper()
+
 
 class AccountAccess:
     """
@@ -10,21 +19,33 @@ class AccountAccess:
     Enforces verification requirements for sensitive operations.
     """
     
-    # Class-level constants for restricted permissions
-    RESTRICTED_PERMISSIONS = {"TRANSFER", "WITHDRAW"}
-    
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('__permissions', '__perms_tuple')
+
+    # Class-level constants for restricted permissions (frozenset: immutable,
+    # hashed membership tests; interned so comparisons hit the
+    # pointer-identity fast path)
+    RESTRICTED_PERMISSIONS = frozenset(map(sys.intern, ("TRANSFER", "WITHDRAW")))
+
     def __init__(self):
-        """Initialize AccountAccess with empty permissions list."""
-        self.__permissions = []  # Private attribute
-    
+        """Initialize AccountAccess with no permissions."""
+        # Dict used as an insertion-ordered set: O(1) membership tests
+        # instead of O(n) list scans.
+        self.__permissions = {}  # Private attribute
+        # Immutable view handed out by get_permissions, rebuilt on mutation
+        self.__perms_tuple = ()
+
     def get_permissions(self):
         """
-        Return a COPY of the permissions list to prevent external modification.
-        
+        Return an immutable view of the permissions.
+
+        The tuple is cached and only rebuilt when permissions change, so
+        reads are O(1) with no allocation.
+
         Returns:
-            list: Copy of permissions
+            tuple: Current permissions
         """
-        return self.__permissions.copy()
+        return self.__perms_tuple
     
     def add_permission(self, permission, is_verified=True):
         """
@@ -37,8 +58,9 @@ class AccountAccess:
         Raises:
             ValueError: If trying to add restricted permission without verification
         """
-        permission = permission.upper()
-        
+        # Interned so later membership tests compare by pointer first
+        permission = sys.intern(_norm(permission))
+
         # Check if permission is restricted and user is not verified
         if permission in self.RESTRICTED_PERMISSIONS and not is_verified:
             raise ValueError(
@@ -48,7 +70,8 @@ class AccountAccess:
         
         # Add permission if not already present
         if permission not in self.__permissions:
-            self.__permissions.append(permission)
+            self.__permissions[permission] = None
+            self.__perms_tuple = tuple(self.__permissions)
         else:
             print(f"Permission '{permission}' already exists.")
     
@@ -62,10 +85,11 @@ class AccountAccess:
         Returns:
             bool: True if removed, False if not found
         """
-        permission = permission.upper()
-        
+        permission = _norm(permission)
+
         if permission in self.__permissions:
-            self.__permissions.remove(permission)
+            del self.__permissions[permission]
+            self.__perms_tuple = tuple(self.__permissions)
             return True
         else:
             print(f"Permission '{permission}' not found.")
@@ -81,8 +105,8 @@ class AccountAccess:
         Returns:
             bool: True if user has permission, False otherwise
         """
-        return permission.upper() in self.__permissions
+        return _norm(permission) in self.__permissions
     
     def __str__(self):
         """String representation of AccountAccess."""
-        return f"AccountAccess(permissions={self.__permissions})"
+        return f"AccountAccess(permissions={list(self.__permissions)})"
@@ -3,17 +3,33 @@ SecureUser Module
 Combines UserIdentity and AccountAccess with composition and comprehensive audit logging.
 """
 
-from datetime import datetime
-from user_identity import UserIdentity
+from collections import deque, namedtuple
+
+from user_identity import UserIdentity, _fast_ts
 from account_access import AccountAccess
 
+# Pending audit entries are flushed into the log in batches of this size
+_FLUSH_THRESHOLD = 64
+
+# Audit-log entry: a slotless tuple is several times smaller than the
+# 3-key dict previously stored per event, with the same field names
+_LogEntry = namedtuple('LogEntry', ('timestamp', 'action', 'details'))
+
 
 class SecureUser:
     """
     Secure user class that combines identity and access control
     with comprehensive audit logging.
     """
-    
+
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('_identity', '__access', '__audit_log', '__pending',
+                 '__status_dirty', '__status_cache', '__is_verified')
+
+    # Class-wide audit switch: when off, __log_action returns before
+    # paying for timestamp formatting or entry allocation
+    audit_enabled = True
+
     def __init__(self, username, email, phone_number):
         """
         Initialize SecureUser with identity and access components.
@@ -25,8 +41,15 @@ class SecureUser:
         """
         self._identity = UserIdentity(username, email, phone_number)  # Protected
         self.__access = AccountAccess()  # Private
-        self.__audit_log = []  # Private
-        
+        self.__audit_log = deque()  # Private
+        self.__pending = []  # Staging buffer of (timestamp, action, details) tuples
+
+        # Status snapshot cache, rebuilt only after a mutation
+        self.__status_dirty = True
+        self.__status_cache = None
+        # Verification is one-way, so the flag only flips in verify_identity
+        self.__is_verified = False
+
         self.__log_action("SecureUser created", f"Username: {username}")
     
     def grant_permission(self, permission):
@@ -39,10 +62,11 @@ class SecureUser:
         Raises:
             ValueError: If verification requirements are not met
         """
-        is_verified = self._identity.get_verification_status() == "VERIFIED"
-        
+        is_verified = self.__is_verified
+
         try:
             self.__access.add_permission(permission, is_verified)
+            self.__status_dirty = True
             self.__log_action(
                 "Permission granted",
                 f"Permission: {permission}, Verified: {is_verified}"
@@ -62,6 +86,8 @@ class SecureUser:
             permission (str): Permission to revoke
         """
         removed = self.__access.remove_permission(permission)
+        if removed:
+            self.__status_dirty = True
         action = "revoked" if removed else "revoke failed (not found)"
         self.__log_action(f"Permission {action}", f"Permission: {permission}")
     
@@ -70,20 +96,42 @@ class SecureUser:
         Get comprehensive identity status information.
         
         Returns:
-            dict: Identity status information
+            dict: Identity status information (permissions as an immutable tuple)
+        """
+        if self.__status_dirty:
+            self.__rebuild_status()
+        # Shallow copy is safe: every cached value is immutable
+        return dict(self.__status_cache)
+
+    def identity_status_tuple(self):
         """
-        return {
+        Get identity status as a plain tuple, with no dict allocation.
+
+        Returns:
+            tuple: (username, email, phone, verification_status, permissions)
+        """
+        if self.__status_dirty:
+            self.__rebuild_status()
+        cache = self.__status_cache
+        return (cache["username"], cache["email"], cache["phone"],
+                cache["verification_status"], cache["permissions"])
+
+    def __rebuild_status(self):
+        """Refresh the cached status snapshot from the components."""
+        self.__status_cache = {
             "username": self._identity.username,
             "email": self._identity.get_email(),
             "phone": self._identity.get_phone_number(),
             "verification_status": self._identity.get_verification_status(),
             "permissions": self.__access.get_permissions()
         }
+        self.__status_dirty = False
     
     def request_verification(self):
         """Request identity verification."""
         try:
             self._identity.request_verification()
+            self.__status_dirty = True
             self.__log_action("Verification requested", "Status: PENDING")
         except ValueError as e:
             self.__log_action("Verification request FAILED", str(e))
@@ -93,6 +141,8 @@ class SecureUser:
         """Verify the user's identity."""
         try:
             self._identity.verify()
+            self.__is_verified = True
+            self.__status_dirty = True
             self.__log_action("Identity verified", "Status: VERIFIED")
         except ValueError as e:
             self.__log_action("Verification FAILED", str(e))
@@ -108,6 +158,7 @@ class SecureUser:
         old_email = self._identity.get_email()
         try:
             self._identity.set_email(new_email)
+            self.__status_dirty = True
             self.__log_action("Email updated", f"{old_email} -> {new_email}")
         except ValueError as e:
             self.__log_action("Email update FAILED", str(e))
@@ -118,25 +169,43 @@ class SecureUser:
         Return a COPY of the audit log to prevent external modification.
         
         Returns:
-            list: Copy of audit log entries
+            list: Copy of audit log entries (LogEntry namedtuples)
         """
-        return self.__audit_log.copy()
-    
+        self.__flush_pending()
+        return list(self.__audit_log)
+
     def __log_action(self, action, details=""):
         """
         Private method to log all actions with timestamp.
-        
+
+        Entries are staged and moved into the log in batches, so the
+        per-action cost is one _LogEntry tuple plus a list.append.
+
         Args:
             action (str): Action performed
             details (str): Additional details
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = {
-            "timestamp": timestamp,
-            "action": action,
-            "details": details
-        }
-        self.__audit_log.append(log_entry)
+        if not self.audit_enabled:
+            return
+        self.__pending.append(_LogEntry(_fast_ts(), action, details))
+        if len(self.__pending) >= _FLUSH_THRESHOLD:
+            self.__flush_pending()
+
+    def __flush_pending(self):
+        """Move staged entries into the log in one extend."""
+        if self.__pending:
+            self.__audit_log.extend(self.__pending)
+            self.__pending.clear()
+
+    @classmethod
+    def enable_audit(cls):
+        """Turn audit logging on for all SecureUser instances."""
+        cls.audit_enabled = True
+
+    @classmethod
+    def disable_audit(cls):
+        """Turn audit logging off for all SecureUser instances."""
+        cls.audit_enabled = False
     
     def __str__(self):
         """String representation of SecureUser."""
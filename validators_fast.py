@@ -0,0 +1,82 @@
+"""
+validators_fast Module
+Numba-JIT-compiled email and phone validators for bulk user creation.
+
+When Numba is available the char-scan loops below are compiled to machine
+code (first call pays the JIT cost, cached to disk afterwards). When it is
+not, the functions stay plain Python and user_identity keeps using its own
+validators instead.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def valid_email(email):
+    """Single-pass structure + charset email check.
+
+    Mirrors user_identity._valid_email: non-empty local part of
+    [a-zA-Z0-9._%+-], '@', a domain of [a-zA-Z0-9.-] whose last dot has at
+    least one character before it and a 2+ letter TLD after it.
+    """
+    n = len(email)
+    at = -1
+    for i in range(n):
+        if email[i] == '@':
+            at = i
+    if at <= 0 or at >= n - 1:
+        return False
+    dot = -1
+    for i in range(at + 1, n):
+        if email[i] == '.':
+            dot = i
+    if dot <= at + 1 or n - dot - 1 < 2:
+        return False
+    for i in range(at):
+        c = email[i]
+        if not ('a' <= c <= 'z' or 'A' <= c <= 'Z' or '0' <= c <= '9'
+                or c == '.' or c == '_' or c == '%' or c == '+' or c == '-'):
+            return False
+    for i in range(at + 1, n):
+        c = email[i]
+        if not ('a' <= c <= 'z' or 'A' <= c <= 'Z' or '0' <= c <= '9'
+                or c == '.' or c == '-'):
+            return False
+    for i in range(dot + 1, n):
+        c = email[i]
+        if not ('a' <= c <= 'z' or 'A' <= c <= 'Z'):
+            return False
+    return True
+
+
+@njit(cache=True)
+def valid_phone(phone):
+    """Single-pass phone check.
+
+    Mirrors user_identity._PHONE_RE: leading '+', then 10-15 digits mixed
+    with optional space/dash/paren separators and nothing else.
+    """
+    n = len(phone)
+    if n == 0 or phone[0] != '+':
+        return False
+    digits = 0
+    for i in range(1, n):
+        c = phone[i]
+        if '0' <= c <= '9':
+            digits += 1
+        elif not (c == ' ' or c == '-' or c == '(' or c == ')'):
+            return False
+    return 10 <= digits <= 15